@@ -5,7 +5,6 @@ from typing import Any, Callable, List, Optional, Tuple, Type, Union
 from django.db.models import Count
 from django.db.models import Model as DjangoModel
 from django.db.models import Q, QuerySet
-from django.db.models.expressions import RawSQL
 from ninja import FilterSchema, Schema
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
@@ -582,24 +581,11 @@ class DescendantsOfConceptFilter(DjangoFilter):
             model = model._queryset_model
         terminology = model._meta.get_field(field).related_model
         concept = terminology.objects.get(code=value)
-        # Get the correct database table name
-        db_table = terminology._meta.db_table
         query = Q(
             **{
                 f"{field}__in": terminology.objects.filter(
-                    id__in=RawSQL(
-                        f"""
-            WITH RECURSIVE descendants AS (
-                SELECT id FROM {db_table} WHERE id = %s
-                UNION ALL
-                SELECT cc.id FROM {db_table} cc
-                JOIN descendants d ON cc.parent_id = d.id
-            )
-            SELECT id FROM descendants WHERE id != %s
-        """,
-                        [concept.id, concept.id],
-                    )
-                )
+                    ancestors__contains=[concept.id]
+                ).values("id")
             }
         )
         return ~query if negative else query
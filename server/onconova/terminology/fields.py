@@ -133,9 +133,9 @@ class DescendsFrom(models.Lookup):
         """
         Converts the lookup into SQL.
 
-        This method is overridden from the Lookup class to create a recursive
-        CTE query that traverses the parent-child relationships of the
-        CodedConceptField.
+        This method is overridden from the Lookup class to match the concept
+        itself and all concepts whose materialized ancestor path contains it,
+        which is resolved through the GIN index on the `ancestors` column.
 
         Args:
             compiler (Any): The SQLCompiler instance.
@@ -150,27 +150,20 @@ class DescendsFrom(models.Lookup):
         rhs, rhs_params = self.process_rhs(compiler, connection)
 
         # Construct the parameters
-        params = lhs_params + rhs_params
+        params = lhs_params + rhs_params + rhs_params
 
         # Get the table name of the left-hand side
         table = lhs.split(".")[0].strip('"')
 
-        # Construct the recursive CTE query
-        recursive_cte = f"""
-		WITH RECURSIVE descendants AS (
-			SELECT id
-			FROM {table}
-			WHERE id = {rhs}
-			UNION ALL
-			SELECT t.id
-			FROM {table} AS t
-			INNER JOIN descendants AS d ON t.parent_id = d.id
-		)
-		SELECT id FROM descendants
+        # Construct the descendants subquery
+        descendants = f"""
+		SELECT id
+		FROM {table}
+		WHERE id = {rhs} OR ancestors @> ARRAY[{rhs}]::uuid[]
 		"""
 
         # Return the SQL query and parameters
-        return "%s IN (%s)" % (lhs, recursive_cte), params
+        return "%s IN (%s)" % (lhs, descendants), params
 
 
 models.ForeignKey.register_lookup(DescendsFrom)
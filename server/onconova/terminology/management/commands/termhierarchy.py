@@ -0,0 +1,93 @@
+import django.apps
+from django.core.management.base import BaseCommand, CommandError
+
+from onconova.terminology.models import CodedConcept
+from onconova.terminology.services import printGreen, printRed, printYellow
+
+
+class Command(BaseCommand):
+    """
+    Django management command to rebuild or check the materialized concept hierarchies.
+
+    Each CodedConcept table stores the path of ancestor concept IDs of every concept, which is
+    used to resolve descendant filters without recursive queries. This command recomputes those
+    paths from the `parent` relationships, or checks whether they are consistent.
+
+    Options:
+
+        --models: A list of CodedConcept model names to process. Use 'all' to process all models.
+        --check: Only report inconsistent hierarchies without modifying the database. Exits with an error if any are found.
+
+    Example:
+        python manage.py termhierarchy --models ICD10Condition AntineoplasticAgent
+        python manage.py termhierarchy --check
+    """
+
+    help = """Rebuilds or checks the materialized concept hierarchies"""
+
+    # ------------------------------------------------------------------------------------------
+    def add_arguments(self, parser):
+        parser.add_argument("--models", nargs="+", type=str, default="all")
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only check the consistency of the hierarchies (no database changes)",
+            default=False,
+        )
+
+    # ------------------------------------------------------------------------------------------
+    def handle(self, *args, **options):
+        """
+        Main handler for the 'termhierarchy' command.
+
+        Args:
+            args (list): Unused positional arguments.
+            options (dict): Command-line options.
+        """
+        if options["models"] == "all":
+            valueset_models = list(
+                django.apps.apps.get_app_config("terminology").get_models()
+            )
+        else:
+            valueset_models = [
+                django.apps.apps.get_model("terminology", valueset_name)
+                for valueset_name in options["models"]
+            ]
+        valueset_models = [
+            model
+            for model in valueset_models
+            if issubclass(model, CodedConcept) and not model._meta.proxy
+        ]
+
+        inconsistent = {}
+        for valueset_model in valueset_models:
+            if options["check"]:
+                count = valueset_model.check_hierarchy()
+                if count:
+                    inconsistent[valueset_model.__name__] = count
+            else:
+                count = valueset_model.rebuild_hierarchy()
+                if count:
+                    printYellow(
+                        f"⬤ - Updated {count} ancestor paths in the <{valueset_model.__name__}> model table."
+                    )
+
+        print("\n-------------------------------------------")
+        print("SUMMARY")
+        if options["check"]:
+            if inconsistent:
+                for name, count in inconsistent.items():
+                    printRed(f"❌ Model <{name}>: {count} inconsistent concept(s)")
+                print("-------------------------------------------")
+                raise CommandError(
+                    f"{len(inconsistent)} CodedConcept-model(s) have inconsistent hierarchies. Run 'termhierarchy' to rebuild them."
+                )
+            printGreen(
+                f"✓ {len(valueset_models)} CodedConcept-model hierarchies are consistent."
+            )
+        else:
+            printGreen(
+                f"✓ {len(valueset_models)} CodedConcept-model hierarchies rebuilt succesfully."
+            )
+        print("-------------------------------------------")
+        print()
@@ -0,0 +1,1248 @@
+# Generated by Django 5.1 on 2026-10-19 04:55
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+HIERARCHY_REBUILD_SQL = """
+    WITH RECURSIVE hierarchy AS (
+        SELECT id, ARRAY[]::uuid[] AS ancestors
+        FROM {table}
+        WHERE parent_id IS NULL
+        UNION ALL
+        SELECT child.id, hierarchy.ancestors || child.parent_id
+        FROM {table} AS child
+        INNER JOIN hierarchy ON child.parent_id = hierarchy.id
+    )
+    UPDATE {table} AS concept
+    SET ancestors = hierarchy.ancestors
+    FROM hierarchy
+    WHERE concept.id = hierarchy.id
+    AND concept.ancestors IS DISTINCT FROM hierarchy.ancestors
+"""
+
+
+def materialize_concept_hierarchies(apps, schema_editor):
+    for model in apps.get_app_config("terminology").get_models():
+        if model._meta.proxy or not any(
+            field.name == "ancestors" for field in model._meta.fields
+        ):
+            continue
+        schema_editor.execute(HIERARCHY_REBUILD_SQL.format(table=model._meta.db_table))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('terminology', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='adjunctivetherapyrole',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='administrativegender',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='adverseeventmitigationdrug',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='adverseeventmitigationmanagement',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='adverseeventmitigationprocedure',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='adverseeventmitigationtreatmentadjustment',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='adverseeventterm',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='alcoholconsumptionfrequency',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='aminoacidchangetype',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='antineoplasticagent',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='binetstage',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='birthsex',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='bodylocationqualifier',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='breslowdepthstage',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='cancermorphology',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='cancerriskassessmentclassification',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='cancerriskassessmentmethod',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='cancertopography',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='cancertreatmentresponse',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='cancertreatmentresponseobservationmethod',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='causeofdeath',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='chromosomeidentifier',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='clarklevel',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='clinorpathmodifier',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='dnachangetype',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='dosageroute',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='ecogperformancestatusinterpretation',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='expecteddrugaction',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='exposureagent',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='familymembertype',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='figostage',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='figostagingmethod',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='genderidentity',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='gene',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='geneticvariantsource',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='genomiccoordinatesystem',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='gleasongradegroupstage',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='histologydifferentiation',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='icd10condition',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='karnofskyperformancestatusinterpretation',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='lateralityqualifier',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='lymphomastage',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='lymphomastagevaluemodifier',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='lymphomastagingmethod',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='microsatelliteinstabilitystate',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='molecularconsequence',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='myelomaissstage',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='myelomarissstage',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='neuroblastomainrgssstage',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='neuroblastomainssstage',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='observationbodysite',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='procedureoutcome',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='race',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='radiotherapymodality',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='radiotherapytechnique',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='radiotherapytreatmentlocation',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='radiotherapytreatmentlocationqualifier',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='radiotherapyvolumetype',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='raistage',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='raistagingmethod',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='recreationaldrug',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='referencegenomebuild',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='rhabdomyosarcomaclinicalgroup',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='smokingstatus',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='structuralvariantanalysismethod',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='surgicalprocedure',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmdistantmetastasescategory',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmdistantmetastasesstagingtype',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmgradecategory',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmlymphaticinvasioncategory',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmperineuralinvasioncategory',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmprimarytumorcategory',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmprimarytumorstagingtype',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmregionalnodescategory',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmregionalnodesstagingtype',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmresidualtumorcategory',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmserumtumormarkerlevelcategory',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmstage',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmstagingmethod',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tnmvenousinvasioncategory',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='treatmentterminationreason',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tumorboardrecommendation',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='tumormarkeranalyte',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='variantinheritance',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='wilmstumorstage',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AddField(
+            model_name='zygosity',
+            name='ancestors',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), default=list, editable=False, size=None),
+        ),
+        migrations.AlterField(
+            model_name='adjunctivetherapyrole',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='administrativegender',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='adverseeventmitigationdrug',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='adverseeventmitigationmanagement',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='adverseeventmitigationprocedure',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='adverseeventmitigationtreatmentadjustment',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='adverseeventterm',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='alcoholconsumptionfrequency',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='aminoacidchangetype',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='antineoplasticagent',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='binetstage',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='birthsex',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='bodylocationqualifier',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='breslowdepthstage',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='cancermorphology',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='cancerriskassessmentclassification',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='cancerriskassessmentmethod',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='cancertopography',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='cancertreatmentresponse',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='cancertreatmentresponseobservationmethod',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='causeofdeath',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='chromosomeidentifier',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='clarklevel',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='clinorpathmodifier',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='dnachangetype',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='dosageroute',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='ecogperformancestatusinterpretation',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='expecteddrugaction',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='exposureagent',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='familymembertype',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='figostage',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='figostagingmethod',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='genderidentity',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='gene',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='geneticvariantsource',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='genomiccoordinatesystem',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='gleasongradegroupstage',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='histologydifferentiation',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='icd10condition',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='karnofskyperformancestatusinterpretation',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='lateralityqualifier',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='lymphomastage',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='lymphomastagevaluemodifier',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='lymphomastagingmethod',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='microsatelliteinstabilitystate',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='molecularconsequence',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='myelomaissstage',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='myelomarissstage',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='neuroblastomainrgssstage',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='neuroblastomainssstage',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='observationbodysite',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='procedureoutcome',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='race',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='radiotherapymodality',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='radiotherapytechnique',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='radiotherapytreatmentlocation',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='radiotherapytreatmentlocationqualifier',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='radiotherapyvolumetype',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='raistage',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='raistagingmethod',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='recreationaldrug',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='referencegenomebuild',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='rhabdomyosarcomaclinicalgroup',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='smokingstatus',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='structuralvariantanalysismethod',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='surgicalprocedure',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmdistantmetastasescategory',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmdistantmetastasesstagingtype',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmgradecategory',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmlymphaticinvasioncategory',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmperineuralinvasioncategory',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmprimarytumorcategory',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmprimarytumorstagingtype',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmregionalnodescategory',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmregionalnodesstagingtype',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmresidualtumorcategory',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmserumtumormarkerlevelcategory',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmstage',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmstagingmethod',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tnmvenousinvasioncategory',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='treatmentterminationreason',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tumorboardrecommendation',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='tumormarkeranalyte',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='variantinheritance',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='wilmstumorstage',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.AlterField(
+            model_name='zygosity',
+            name='code',
+            field=models.CharField(help_text='Code as defined in the code system', max_length=200, verbose_name='Code'),
+        ),
+        migrations.RunPython(
+            materialize_concept_hierarchies, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name='adjunctivetherapyrole',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_46d7b0_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='administrativegender',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_5be9c2_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='adverseeventmitigationdrug',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_d130ed_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='adverseeventmitigationmanagement',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_b80204_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='adverseeventmitigationprocedure',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_62031e_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='adverseeventmitigationtreatmentadjustment',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_48f46c_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='adverseeventterm',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_2d7511_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='alcoholconsumptionfrequency',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_5ac7fe_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='aminoacidchangetype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_79b4c6_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='antineoplasticagent',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_86f8cd_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='binetstage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_f7e877_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='birthsex',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_1008b1_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='bodylocationqualifier',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_f94a7b_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='breslowdepthstage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_291ba6_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='cancermorphology',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_1c631d_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='cancerriskassessmentclassification',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_715e26_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='cancerriskassessmentmethod',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_c23563_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='cancertopography',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_6441a0_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='cancertreatmentresponse',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_6f3042_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='cancertreatmentresponseobservationmethod',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_5fabc7_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='causeofdeath',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_66d16f_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='chromosomeidentifier',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_d4b37f_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='clarklevel',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_92ab81_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='clinorpathmodifier',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_345cbe_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='dnachangetype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_c50246_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='dosageroute',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_0400e9_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='ecogperformancestatusinterpretation',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_99ef82_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='expecteddrugaction',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_0b4654_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='exposureagent',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_bd5fc4_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='familymembertype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_ba8f7f_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='figostage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_5657f3_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='figostagingmethod',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_1dfbfa_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='genderidentity',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_04eb21_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='gene',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_642b2a_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='geneticvariantsource',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_fe4515_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='genomiccoordinatesystem',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_608418_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='gleasongradegroupstage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_35783a_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='histologydifferentiation',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_9ae2c4_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='icd10condition',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_c3ef50_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='karnofskyperformancestatusinterpretation',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_784355_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='lateralityqualifier',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_708f8b_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='lymphomastage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_cd9796_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='lymphomastagevaluemodifier',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_964f95_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='lymphomastagingmethod',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_00f42b_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='microsatelliteinstabilitystate',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_51fffe_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='molecularconsequence',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_c2a308_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='myelomaissstage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_3e9cf1_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='myelomarissstage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_6ff460_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='neuroblastomainrgssstage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_b512da_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='neuroblastomainssstage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_c65610_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='observationbodysite',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_dd3f62_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='procedureoutcome',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_47f0bc_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='race',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_dcf68e_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='radiotherapymodality',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_5b2477_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='radiotherapytechnique',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_c59c33_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='radiotherapytreatmentlocation',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_61349c_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='radiotherapytreatmentlocationqualifier',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_4d462b_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='radiotherapyvolumetype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_1c8fd3_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='raistage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_8079b6_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='raistagingmethod',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_684071_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='recreationaldrug',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_b0812d_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='referencegenomebuild',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_25250e_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='rhabdomyosarcomaclinicalgroup',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_53af5e_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='smokingstatus',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_e66826_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='structuralvariantanalysismethod',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_616c74_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='surgicalprocedure',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_b0567c_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmdistantmetastasescategory',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_dba549_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmdistantmetastasesstagingtype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_492e9e_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmgradecategory',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_198a23_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmlymphaticinvasioncategory',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_6e2bfd_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmperineuralinvasioncategory',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_a7c561_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmprimarytumorcategory',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_23b3c3_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmprimarytumorstagingtype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_54974e_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmregionalnodescategory',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_f4045e_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmregionalnodesstagingtype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_8c8be2_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmresidualtumorcategory',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_f463ca_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmserumtumormarkerlevelcategory',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_ff9395_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmstage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_2bd55d_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmstagingmethod',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_77f8cd_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tnmvenousinvasioncategory',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_ff3f1f_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='treatmentterminationreason',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_3b8056_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tumorboardrecommendation',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_91480b_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tumormarkeranalyte',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_1a6d24_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='variantinheritance',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_12cc32_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='wilmstumorstage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_532844_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='zygosity',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ancestors'], name='terminology_ancesto_4dd792_gin'),
+        ),
+    ]
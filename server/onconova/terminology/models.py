@@ -2,7 +2,8 @@ from typing import ClassVar, List
 
 from django.contrib.postgres import fields as postgres
 from django.contrib.postgres.fields import IntegerRangeField
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.db import connections, models, router, transaction
 from django.db.models.functions import Concat
 from django.utils.translation import gettext_lazy as _
 from queryable_properties.managers import QueryablePropertiesManager
@@ -11,6 +12,46 @@ from queryable_properties.properties import AnnotationProperty
 from onconova.core.models import BaseModel
 from onconova.terminology.utils import CodedConcept as CodedConceptSchema
 
+HIERARCHY_CTE_SQL = """
+    WITH RECURSIVE hierarchy AS (
+        SELECT id, ARRAY[]::uuid[] AS ancestors
+        FROM {table}
+        WHERE parent_id IS NULL
+        UNION ALL
+        SELECT child.id, hierarchy.ancestors || child.parent_id
+        FROM {table} AS child
+        INNER JOIN hierarchy ON child.parent_id = hierarchy.id
+    )
+"""
+
+HIERARCHY_REBUILD_SQL = (
+    HIERARCHY_CTE_SQL
+    + """
+    UPDATE {table} AS concept
+    SET ancestors = hierarchy.ancestors
+    FROM hierarchy
+    WHERE concept.id = hierarchy.id
+    AND concept.ancestors IS DISTINCT FROM hierarchy.ancestors
+"""
+)
+"""
+SQL template that recomputes the materialized ancestor paths of a terminology table from its `parent_id` links.
+"""
+
+HIERARCHY_CHECK_SQL = (
+    HIERARCHY_CTE_SQL
+    + """
+    SELECT COUNT(*)
+    FROM {table} AS concept
+    LEFT JOIN hierarchy ON concept.id = hierarchy.id
+    WHERE hierarchy.id IS NULL
+    OR concept.ancestors IS DISTINCT FROM hierarchy.ancestors
+"""
+)
+"""
+SQL template that counts the concepts of a terminology table whose materialized ancestor path is out of sync.
+"""
+
 
 class CodedConcept(BaseModel):
     """
@@ -23,6 +64,7 @@ class CodedConcept(BaseModel):
         version (models.CharField): Version of the code system.
         synonyms (models.ArrayField[models.CharField]): List of synonyms for the concept.
         parent (models.ForeignKey[CodedConcept]): Reference to a parent concept (self-referential).
+        ancestors (models.ArrayField[models.UUIDField]): Materialized path of ancestor concept IDs, ordered from the root to the parent.
         definition (models.TextField): Optional detailed definition of the concept.
         properties (models.JSONField): Additional properties as a JSON object.
         valueset (str): Class variable for the associated value set (to be defined in subclasses).
@@ -34,6 +76,10 @@ class CodedConcept(BaseModel):
         
         - unique_together: Ensures uniqueness for code and system pairs.
 
+    Indexes:
+
+        - GIN index on `ancestors` to resolve descendant queries as a containment lookup.
+
     """
     code = models.CharField(
         verbose_name="Code",
@@ -73,6 +119,11 @@ class CodedConcept(BaseModel):
         null=True,
         blank=True,
     )
+    ancestors = postgres.ArrayField(
+        base_field=models.UUIDField(),
+        default=list,
+        editable=False,
+    )
     definition = models.TextField(
         blank=True,
         null=True,
@@ -93,6 +144,7 @@ class CodedConcept(BaseModel):
 
     class Meta:
         unique_together = ["code", "system"]
+        indexes = [GinIndex(fields=["ancestors"])]
         abstract = True
 
     def __str__(self):
@@ -101,6 +153,94 @@ class CodedConcept(BaseModel):
         else:
             return f"{self.__class__.__name__}: {self.code}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if "parent_id" not in instance.get_deferred_fields():
+            instance._loaded_parent_id = instance.parent_id
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Saves the concept, keeping the materialized ancestor paths of the concept and its descendants in sync.
+
+        The ancestor path is only recomputed when the concept is created or its parent has changed.
+        """
+        adding = self._state.adding
+        if adding:
+            reparented = True
+        elif hasattr(self, "_loaded_parent_id"):
+            reparented = self.parent_id != self._loaded_parent_id
+        else:
+            # The parent was not loaded from the database, so it can only have changed if it was assigned
+            reparented = "parent_id" not in self.get_deferred_fields()
+        if reparented:
+            if self.parent_id:
+                parent_ancestors = (
+                    self.__class__._base_manager.filter(pk=self.parent_id)
+                    .values_list("ancestors", flat=True)
+                    .get()
+                )
+                self.ancestors = [*parent_ancestors, self.parent_id]
+            else:
+                self.ancestors = []
+            if self.pk in self.ancestors:
+                raise ValueError(
+                    f"Concept {self.code} cannot be a descendant of itself."
+                )
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "ancestors"}
+        using = kwargs.get("using") or router.db_for_write(
+            self.__class__, instance=self
+        )
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+            if reparented and not adding:
+                # Re-root the ancestor paths of all descendants onto the new path
+                with connections[using].cursor() as cursor:
+                    cursor.execute(
+                        f"""
+                        UPDATE {self._meta.db_table}
+                        SET ancestors = %s::uuid[] || ancestors[array_position(ancestors, %s):]
+                        WHERE ancestors @> ARRAY[%s]::uuid[]
+                        """,
+                        [self.ancestors, self.pk, self.pk],
+                    )
+        if "parent_id" not in self.get_deferred_fields():
+            self._loaded_parent_id = self.parent_id
+
+    @classmethod
+    def rebuild_hierarchy(cls, using: str = "default") -> int:
+        """
+        Recomputes the materialized ancestor paths of all concepts from their parent relationships.
+
+        Args:
+            using (str): The database alias to rebuild the hierarchy on.
+
+        Returns:
+            (int): The number of concepts whose ancestor path was updated.
+        """
+        with connections[using].cursor() as cursor:
+            cursor.execute(HIERARCHY_REBUILD_SQL.format(table=cls._meta.db_table))
+            return cursor.rowcount
+
+    @classmethod
+    def check_hierarchy(cls, using: str = "default") -> int:
+        """
+        Counts the concepts whose materialized ancestor path does not match their parent relationships.
+
+        Concepts that are part of a parent cycle are never reachable from a root concept and are always reported.
+
+        Args:
+            using (str): The database alias to check the hierarchy on.
+
+        Returns:
+            (int): The number of inconsistent concepts.
+        """
+        with connections[using].cursor() as cursor:
+            cursor.execute(HIERARCHY_CHECK_SQL.format(table=cls._meta.db_table))
+            return cursor.fetchone()[0]
+
 
 class FamilyMemberType(CodedConcept):
     """
@@ -442,9 +442,14 @@ def collect_codedconcept_terminology(
             parent = CodedConceptModel.objects.filter(
                 code=concept.parent, system=concept.system
             ).first()
-            if parent:
-                child.parent = parent  # type: ignore
-                child.save()
+            if parent and child.parent_id != parent.pk:
+                # Bypass the per-concept ancestor propagation, the hierarchy is rebuilt in bulk below
+                CodedConceptModel._base_manager.filter(pk=child.pk).update(
+                    parent=parent
+                )
+    if write_db:
+        CodedConceptModel.rebuild_hierarchy()
+        print("✓ - Concept hierarchy materialized")
     print("✓ - All concepts written into the database")
     # Delete dangling concepts
     if concepts and dangling_concepts and prune_dangling:
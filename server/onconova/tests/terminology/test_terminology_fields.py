@@ -35,3 +35,44 @@ class TestDescendsFromLookup(TestCase):
         self.assertTrue(self.uncle not in query)
         self.assertTrue(self.grandparent not in query)
         self.assertTrue(self.grandparent not in query)
+
+
+class TestCodedConceptHierarchy(TestCase):
+
+    def setUp(self):
+        factory = make_terminology_factory(MockCodedConcept).get_factory()  # type: ignore
+        self.grandparent = factory()
+        self.parent = factory(parent=self.grandparent)
+        self.concept = factory(parent=self.parent)
+
+    def test_ancestors_materialized_on_create(self):
+        self.concept.refresh_from_db()
+        self.assertEqual(self.concept.ancestors, [self.grandparent.pk, self.parent.pk])
+
+    def test_ancestors_propagated_to_descendants_on_reparenting(self):
+        self.parent.parent = None
+        self.parent.save()
+        self.concept.refresh_from_db()
+        self.assertEqual(self.concept.ancestors, [self.parent.pk])
+
+    def test_deferred_parent_is_not_treated_as_reparenting(self):
+        concept = MockCodedConcept.objects.only("id", "code").get(pk=self.parent.pk)
+        concept.code = "renamed-code"
+        concept.save()
+        self.parent.refresh_from_db()
+        self.assertEqual(self.parent.ancestors, [self.grandparent.pk])
+        self.concept.refresh_from_db()
+        self.assertEqual(self.concept.ancestors, [self.grandparent.pk, self.parent.pk])
+
+    def test_reparenting_onto_descendant_is_rejected(self):
+        self.grandparent.parent = self.concept
+        with self.assertRaises(ValueError):
+            self.grandparent.save()
+
+    def test_check_and_rebuild_hierarchy(self):
+        MockCodedConcept.objects.filter(pk=self.parent.pk).update(parent=None)
+        self.assertEqual(MockCodedConcept.check_hierarchy(), 2)
+        self.assertEqual(MockCodedConcept.rebuild_hierarchy(), 2)
+        self.assertEqual(MockCodedConcept.check_hierarchy(), 0)
+        self.concept.refresh_from_db()
+        self.assertEqual(self.concept.ancestors, [self.parent.pk])
@@ -331,6 +331,25 @@ class TestCollectCodedConceptTerminology(unittest.TestCase):
         parent_concept = CodedConceptTestModel.objects.get(code="code1")
         self.assertEqual(child_concept.parent, parent_concept)
 
+    @patch("onconova.terminology.services.download_valueset")
+    def test_materializing_concept_hierarchy(self, mock_download_valueset):
+        CodedConceptTestModel.valueset = "https://example.com/valueset"
+        mock_download_valueset.return_value = [
+            CodedConcept(
+                code="code3", system="system1", display="display3", parent="code2"
+            ),
+            CodedConcept(
+                code="code2", system="system1", display="display2", parent="code1"
+            ),
+            CodedConcept(code="code1", system="system1", display="display1"),
+        ]
+        collect_codedconcept_terminology(CodedConceptTestModel)
+        root = CodedConceptTestModel.objects.get(code="code1")
+        parent = CodedConceptTestModel.objects.get(code="code2")
+        child = CodedConceptTestModel.objects.get(code="code3")
+        self.assertEqual(child.ancestors, [root.pk, parent.pk])
+        self.assertEqual(CodedConceptTestModel.check_hierarchy(), 0)
+
     @patch("onconova.terminology.services.download_valueset")
     def test_prune_danling_concepts(self, mock_download_valueset):
         CodedConceptTestModel.valueset = "https://example.com/valueset"